@@ -0,0 +1,37 @@
+"""
+5X Finder - 페이지 공용 리소스
+데이터/모델 로드는 프로세스 단위로 캐시되어 모든 세션이 공유합니다.
+pandas, joblib은 해당 로더가 처음 호출될 때만 import 합니다.
+"""
+
+import streamlit as st
+import os
+
+# =============================================================================
+# 경로 설정
+# =============================================================================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, 'data', 'processed')
+MODEL_DIR = os.path.join(BASE_DIR, 'models')
+
+# =============================================================================
+# 데이터 로드 함수
+# =============================================================================
+# 페이지에서 읽기 전용으로만 사용하므로 cache_resource로 공유 (rerun마다 복사하지 않음)
+@st.cache_resource
+def load_data():
+    import pandas as pd
+    dataset = pd.read_parquet(os.path.join(DATA_DIR, 'ml_dataset.parquet'))
+    return dataset
+
+@st.cache_resource
+def load_model():
+    import joblib
+    model = joblib.load(os.path.join(MODEL_DIR, 'final_model.joblib'))
+    return model
+
+@st.cache_data
+def load_features():
+    with open(os.path.join(DATA_DIR, 'feature_columns.txt'), 'r') as f:
+        features = [line.strip() for line in f.readlines()]
+    return features
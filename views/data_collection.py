@@ -0,0 +1,119 @@
+"""
+5X Finder - 📊 데이터 수집 페이지
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+st.title("📊 데이터 수집")
+
+tab1, tab2 = st.tabs(["📥 수집 현황", "🔄 동적 필터링"])
+
+with tab1:
+    st.markdown("### 데이터 수집 현황")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("S&P 500 종목", "503개", "전체")
+    with col2:
+        st.metric("수집 완료", "502개", "99.8%")
+    with col3:
+        st.metric("수집 실패", "1개", "WBA")
+
+    st.markdown("---")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        #### 📈 가격 데이터
+        - **기간:** 20년치 OHLCV + Adj Close
+        - **형식:** .parquet (빠르고 용량 작음)
+        - **소스:** yfinance API
+        """)
+
+    with col2:
+        st.markdown("""
+        #### 📋 재무제표
+        - **종류:** 손익계산서, 재무상태표, 현금흐름표
+        - **기간:** 연간 + 분기
+        - **소스:** yfinance API
+        """)
+
+    st.warning("⚠️ **WBA (Walgreens Boots Alliance)**: 상장폐지로 인해 데이터 수집 실패")
+
+with tab2:
+    st.markdown("### 🔄 동적 필터링이란?")
+
+    st.markdown("""
+    종목마다 **상장 시점이 다름** → 각 연도에 실제 데이터가 있는 종목만 사용
+    """)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.error("""
+        **고정 필터링 - 문제점**
+
+        2010년: META 포함 (2012년 상장인데!)
+
+        → **Data Leakage** (미래 정보 누출)
+        """)
+
+    with col2:
+        st.success("""
+        **동적 필터링 - 해결**
+
+        2010년: META 제외 (아직 상장 전)
+
+        → 각 연도에 실제 존재한 종목만!
+        """)
+
+    st.markdown("---")
+
+    # 인터랙티브: 연도 선택
+    year_data = {
+        2010: {'count': 435, 'new': ['TSLA', 'GM']},
+        2011: {'count': 442, 'new': []},
+        2012: {'count': 451, 'new': ['META']},
+        2013: {'count': 460, 'new': ['ABBV', 'ZTS']},
+        2014: {'count': 466, 'new': []},
+        2015: {'count': 471, 'new': ['PYPL']},
+        2016: {'count': 477, 'new': []},
+        2017: {'count': 479, 'new': []},
+        2018: {'count': 482, 'new': []},
+        2019: {'count': 489, 'new': ['UBER', 'CRWD', 'DDOG']}
+    }
+
+    selected_year = st.slider("📅 연도 선택", 2010, 2019, 2010)
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        st.metric(
+            f"{selected_year}년 사용 가능 종목",
+            f"{year_data[selected_year]['count']}개"
+        )
+
+        if year_data[selected_year]['new']:
+            st.markdown(f"**{selected_year}년 신규 상장:**")
+            for ticker in year_data[selected_year]['new']:
+                st.markdown(f"- {ticker}")
+
+    with col2:
+        chart_data = pd.DataFrame({
+            '연도': list(year_data.keys()),
+            '종목 수': [v['count'] for v in year_data.values()]
+        })
+        chart_data['선택'] = chart_data['연도'].apply(
+            lambda x: '선택' if x == selected_year else '기타'
+        )
+
+        fig = px.bar(chart_data, x='연도', y='종목 수', 
+                    color='선택',
+                    color_discrete_map={'선택': '#e74c3c', '기타': '#3498db'},
+                    text='종목 수')
+        fig.update_traces(textposition='outside')
+        fig.update_layout(showlegend=False, height=350)
+        st.plotly_chart(fig, use_container_width=True)
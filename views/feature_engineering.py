@@ -0,0 +1,173 @@
+"""
+5X Finder - 🔧 Feature Engineering 페이지
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from resources import load_data
+
+# =============================================================================
+# Feature 설명 딕셔너리
+# =============================================================================
+FEATURE_DESC = {
+    'revenue_cagr_3y': ('성장성', '3년 매출 성장률 (CAGR)'),
+    'gross_margin': ('수익성', '매출총이익률'),
+    'operating_margin': ('수익성', '영업이익률'),
+    'fcf_margin': ('수익성', '잉여현금흐름 마진'),
+    'operating_margin_trend': ('수익성', '영업이익률 추세'),
+    'roe': ('효율성', '자기자본이익률 (Return on Equity)'),
+    'roa': ('효율성', '총자산이익률 (Return on Assets)'),
+    'roic': ('효율성', '투하자본수익률'),
+    'capex_to_revenue': ('투자', '설비투자/매출 비율'),
+    'capex_to_depreciation': ('투자', '설비투자/감가상각 비율'),
+    'reinvestment_rate': ('투자', '재투자율'),
+    'debt_to_equity': ('재무안정성', '부채비율'),
+    'interest_coverage': ('재무안정성', '이자보상배율'),
+    'current_ratio': ('재무안정성', '유동비율'),
+    'fcf_positive_years': ('품질', 'FCF 양수 연도 수'),
+    'earnings_quality': ('품질', '이익의 질'),
+    'ps_ratio': ('밸류에이션', '주가매출비율 (PSR)'),
+    'pe_ratio': ('밸류에이션', '주가수익비율 (PER)'),
+    'pb_ratio': ('밸류에이션', '주가순자산비율 (PBR)'),
+    'peg_ratio': ('밸류에이션', 'PEG 비율'),
+    'fcf_yield': ('밸류에이션', 'FCF 수익률'),
+    'price_momentum_12m': ('모멘텀', '12개월 가격 모멘텀'),
+    'volatility_1y': ('모멘텀', '1년 변동성'),
+    'volatility_3m': ('모멘텀', '3개월 변동성'),
+    'price_to_sma_50': ('모멘텀', '50일 이동평균 대비'),
+    'price_to_sma_200': ('모멘텀', '200일 이동평균 대비')
+}
+
+st.title("🔧 Feature Engineering")
+
+try:
+    dataset = load_data()
+    data_loaded = True
+except Exception as e:
+    st.error(f"데이터 로드 실패: {e}")
+    data_loaded = False
+
+if data_loaded:
+    tab1, tab2, tab3 = st.tabs(["🎯 Target 분포", "📋 Feature 탐색", "🔥 Feature Selection"])
+
+    with tab1:
+        st.markdown("### Target: 5년 후 5배(500%) 이상 상승 여부")
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("전체 샘플", f"{len(dataset):,}개")
+        with col2:
+            st.metric("5배 달성", f"{dataset['target_5x'].sum():,}개", f"{dataset['target_5x'].mean()*100:.1f}%")
+        with col3:
+            st.metric("미달성", f"{(dataset['target_5x']==0).sum():,}개")
+
+        st.markdown("---")
+
+        selected_year = st.selectbox(
+            "📅 연도별 Target 분포 보기",
+            ['전체'] + list(range(2010, 2020))
+        )
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            if selected_year == '전체':
+                data = dataset
+            else:
+                data = dataset[dataset['start_year'] == selected_year]
+
+            target_counts = data['target_5x'].value_counts()
+            fig = px.pie(
+                values=target_counts.values,
+                names=['미달성', '5배 달성'],
+                title=f'{selected_year} Target 분포',
+                color_discrete_sequence=['#3498db', '#e74c3c']
+            )
+            fig.update_traces(textinfo='percent+value')
+            st.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            if selected_year != '전체':
+                achieved = data[data['target_5x'] == 1]['ticker'].tolist()
+                if achieved:
+                    st.markdown(f"**{selected_year}년 시작 → 5배 달성 종목:**")
+                    for t in achieved[:10]:
+                        st.markdown(f"- {t}")
+                    if len(achieved) > 10:
+                        st.markdown(f"...외 {len(achieved)-10}개")
+                else:
+                    st.info("5배 달성 종목 없음")
+            else:
+                st.markdown("""
+                **클래스 불균형 문제**
+
+                - 5배 달성: **4.6%** (213개)
+                - 미달성: **95.4%** (4,439개)
+
+                **해결: SMOTE**
+                - 소수 클래스 합성하여 균형
+                - Train 데이터: 50% vs 50%
+                """)
+
+    with tab2:
+        st.markdown("### Feature 탐색")
+
+        categories = {}
+        for feat, (cat, desc) in FEATURE_DESC.items():
+            if cat not in categories:
+                categories[cat] = []
+            categories[cat].append((feat, desc))
+
+        col1, col2 = st.columns([1, 2])
+
+        with col1:
+            selected_cat = st.selectbox("카테고리 선택", list(categories.keys()))
+
+            feature_options = [f"{feat}" for feat, desc in categories[selected_cat]]
+            selected_feat = st.selectbox("Feature 선택", feature_options)
+
+        with col2:
+            if selected_feat in dataset.columns:
+                cat, desc = FEATURE_DESC[selected_feat]
+
+                st.markdown(f"**{selected_feat}**")
+                st.markdown(f"- 카테고리: {cat}")
+                st.markdown(f"- 설명: {desc}")
+
+                fig = px.histogram(
+                    dataset, x=selected_feat, 
+                    color='target_5x',
+                    barmode='overlay',
+                    labels={'target_5x': 'Target'},
+                    color_discrete_map={0: '#3498db', 1: '#e74c3c'},
+                    title=f'{selected_feat} 분포'
+                )
+                fig.update_layout(height=300)
+                st.plotly_chart(fig, use_container_width=True)
+
+    with tab3:
+        st.markdown("### Feature Selection: 42개 → 26개")
+
+        removal_reason = st.radio(
+            "제거 사유 선택",
+            ["결측치 50% 이상", "상관관계 0.8 이상"],
+            horizontal=True
+        )
+
+        if removal_reason == "결측치 50% 이상":
+            removed = pd.DataFrame({
+                'Feature': ['revenue_cagr_5y', 'rnd_growth_rate', 'rnd_to_revenue'],
+                '결측치': ['100%', '69.6%', '68.8%'],
+                '이유': ['Yahoo Finance가 4~5년치만 제공', 'R&D 비용 미공시 기업 많음', '위와 동일']
+            })
+            st.dataframe(removed, use_container_width=True, hide_index=True)
+        else:
+            removed = pd.DataFrame({
+                'Feature 1': ['ps_ratio', 'operating_margin', 'price_momentum_6m'],
+                'Feature 2': ['ev_to_revenue', 'net_margin', 'price_to_sma_200'],
+                '상관계수': [0.974, 0.893, 0.917],
+                '제거 대상': ['ev_to_revenue', 'net_margin', 'price_momentum_6m']
+            })
+            st.dataframe(removed, use_container_width=True, hide_index=True)
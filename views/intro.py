@@ -0,0 +1,75 @@
+"""
+5X Finder - 🏠 프로젝트 소개 페이지
+정적 콘텐츠만 렌더링하므로 pandas, plotly, 모델을 import 하지 않습니다.
+"""
+
+import streamlit as st
+
+st.title("5X Finder 📈")
+st.markdown("### 5년 내 5배 성장할 종목을 찾아주는 ML 시스템")
+
+st.markdown("---")
+
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    st.metric("ROC-AUC", "0.872")
+with col2:
+    st.metric("Recall", "0.806", "31개 중 25개 발굴")
+with col3:
+    st.metric("Precision", "0.111")
+with col4:
+    st.metric("샘플 수", "4,652개")
+
+st.markdown("---")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown("""
+    ## 🎯 프로젝트 목표
+
+    Baillie Gifford의 장기 성장주 투자 철학에서 영감을 받아,  
+    **5년 내 5배(500%) 이상 성장할 가능성이 높은 종목**을 머신러닝으로 예측합니다.
+
+    ## 📊 데이터 개요
+
+    | 항목 | 내용 |
+    |------|------|
+    | 데이터 소스 | S&P 500 구성 종목 |
+    | 수집 종목 | 502/503개 (99.8%) |
+    | 기간 | 2010년 ~ 2019년 |
+    | 샘플 수 | 4,652개 |
+    | Feature 수 | 26개 |
+    """)
+
+with col2:
+    st.markdown("""
+    ## 🤖 모델 정보
+
+    | 항목 | 내용 |
+    |------|------|
+    | 알고리즘 | Logistic Regression |
+    | 선택 이유 | Recall 기준 최고 성능 |
+    | ROC-AUC | 0.872 |
+    | Recall | 0.806 |
+
+    ## 📈 핵심 인사이트
+
+    | 발견 | 설명 |
+    |------|------|
+    | 복잡한 모델 ≠ 좋은 모델 | LR이 XGBoost보다 Recall 높음 |
+    | ROE 낮을수록 5배 확률 ↑ | 성장 여력 있는 기업 |
+    | 변동성 높을수록 5배 확률 ↑ | 고위험 고수익 |
+    """)
+
+st.markdown("---")
+
+st.markdown("## 🔄 ML 파이프라인")
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.info("**02. 데이터 수집**\n\nS&P 500 502개 종목\n\nyfinance API")
+with col2:
+    st.info("**03. Feature Engineering**\n\n42→26개 Feature\n\nSMOTE 클래스 균형")
+with col3:
+    st.info("**04. 모델 학습**\n\n5개 모델 비교\n\nLogistic Regression 선택")
@@ -0,0 +1,148 @@
+"""
+5X Finder - 🤖 모델 학습 페이지
+학습 결과(고정 수치)만 보여주므로 데이터/모델을 로드하지 않습니다.
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+st.title("🤖 모델 학습")
+
+tab1, tab2, tab3 = st.tabs(["📊 모델 비교", "📈 Confusion Matrix", "🎯 Feature Importance"])
+
+with tab1:
+    st.markdown("### 5개 모델 점진적 비교")
+
+    model_data = {
+        'Logistic Regression': {'ROC-AUC': 0.872, 'Recall': 0.806, 'Precision': 0.111, 'desc': '가장 간단한 모델, 베이스라인'},
+        'Decision Tree': {'ROC-AUC': 0.873, 'Recall': 0.774, 'Precision': 0.171, 'desc': '비선형 관계 학습 가능'},
+        'Random Forest': {'ROC-AUC': 0.882, 'Recall': 0.677, 'Precision': 0.169, 'desc': '트리 여러 개 병렬 학습'},
+        'Gradient Boosting': {'ROC-AUC': 0.887, 'Recall': 0.645, 'Precision': 0.180, 'desc': '이전 모델 오차 순차 학습'},
+        'XGBoost': {'ROC-AUC': 0.878, 'Recall': 0.645, 'Precision': 0.196, 'desc': 'Gradient Boosting 개선 버전'}
+    }
+
+    selected_model = st.selectbox("🤖 모델 선택", list(model_data.keys()))
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        data = model_data[selected_model]
+        st.metric("ROC-AUC", f"{data['ROC-AUC']:.3f}")
+        st.metric("Recall", f"{data['Recall']:.3f}")
+        st.metric("Precision", f"{data['Precision']:.3f}")
+        st.markdown(f"**설명:** {data['desc']}")
+
+        if selected_model == 'Logistic Regression':
+            st.success("✅ **최종 선택** (Recall 기준)")
+
+    with col2:
+        compare_df = pd.DataFrame([
+            {'Model': k, 'ROC-AUC': v['ROC-AUC'], 'Recall': v['Recall']}
+            for k, v in model_data.items()
+        ])
+
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            name='ROC-AUC', x=compare_df['Model'], y=compare_df['ROC-AUC'],
+            marker_color=['#e74c3c' if m == selected_model else '#3498db' for m in compare_df['Model']]
+        ))
+        fig.add_trace(go.Bar(
+            name='Recall', x=compare_df['Model'], y=compare_df['Recall'],
+            marker_color=['#e74c3c' if m == selected_model else '#2ecc71' for m in compare_df['Model']]
+        ))
+        fig.update_layout(barmode='group', height=350)
+        fig.update_xaxes(tickangle=45)
+        st.plotly_chart(fig, use_container_width=True)
+
+    st.info("**핵심 발견:** ROC-AUC는 복잡한 모델일수록 상승, Recall은 하락 → 복잡한 모델 ≠ 더 좋은 모델!")
+
+with tab2:
+    st.markdown("### Confusion Matrix (Test: 971개)")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        cm_data = [[739, 201], [6, 25]]
+
+        fig = go.Figure(data=go.Heatmap(
+            z=cm_data,
+            x=['예측: 미달성', '예측: 5배'],
+            y=['실제: 미달성', '실제: 5배'],
+            text=[['TN: 739', 'FP: 201'], ['FN: 6', 'TP: 25']],
+            texttemplate='%{text}',
+            textfont={'size': 16},
+            colorscale='Blues'
+        ))
+        fig.update_layout(height=350)
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        cm_item = st.radio(
+            "항목 선택",
+            ["TP (25)", "FN (6)", "FP (201)", "TN (739)"]
+        )
+
+        explanations = {
+            "TP (25)": "**정확히 찾음!** 5배 달성 종목 31개 중 25개 발굴 성공",
+            "FN (6)": "**놓침** 5배 달성 종목 6개를 미달성으로 잘못 예측",
+            "FP (201)": "**헛발질** 5배 아닌데 5배라고 예측",
+            "TN (739)": "**걸러냄** 5배 안 갈 종목 정확히 걸러냄"
+        }
+
+        st.info(explanations[cm_item])
+
+        st.markdown("""
+        **Precision** = 25 / (25+201) = **11%**
+
+        **Recall** = 25 / (25+6) = **81%**
+        """)
+
+with tab3:
+    st.markdown("### Feature Importance")
+
+    coef_data = pd.DataFrame({
+        'feature': ['roe', 'volatility_1y', 'pb_ratio', 'roa', 'reinvestment_rate', 
+                   'operating_margin_trend', 'fcf_yield', 'earnings_quality', 'pe_ratio', 'operating_margin'],
+        'coefficient': [-2.037, 0.947, 0.870, 0.746, 0.507, -0.505, 0.427, -0.417, 0.371, 0.367]
+    })
+
+    selected_feat = st.selectbox("Feature 선택", coef_data['feature'].tolist())
+
+    selected_coef = coef_data[coef_data['feature'] == selected_feat]['coefficient'].values[0]
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        st.metric(selected_feat, f"{selected_coef:+.3f}", delta="5배 확률 ↑" if selected_coef > 0 else "5배 확률 ↓")
+
+        interpretations = {
+            'roe': 'ROE 낮을수록 5배 확률 ↑ (성장 여력)',
+            'volatility_1y': '변동성 높을수록 5배 확률 ↑ (고위험 고수익)',
+            'pb_ratio': 'PBR 높을수록 5배 확률 ↑ (시장 기대)',
+            'roa': 'ROA 높을수록 5배 확률 ↑',
+            'reinvestment_rate': '재투자율 높을수록 5배 확률 ↑',
+            'operating_margin_trend': '영업이익률 추세 하락 시 5배 확률 ↑',
+            'fcf_yield': 'FCF 수익률 높을수록 5배 확률 ↑',
+            'earnings_quality': '이익의 질 낮을수록 5배 확률 ↑',
+            'pe_ratio': 'PER 높을수록 5배 확률 ↑',
+            'operating_margin': '영업이익률 높을수록 5배 확률 ↑'
+        }
+
+        st.markdown(f"**해석:** {interpretations.get(selected_feat, '')}")
+
+    with col2:
+        coef_sorted = coef_data.sort_values('coefficient', ascending=True)
+        colors = ['#e74c3c' if f == selected_feat else ('#27ae60' if c > 0 else '#3498db') 
+                 for f, c in zip(coef_sorted['feature'], coef_sorted['coefficient'])]
+
+        fig = go.Figure(go.Bar(
+            x=coef_sorted['coefficient'],
+            y=coef_sorted['feature'],
+            orientation='h',
+            marker_color=colors,
+            text=[f'{v:+.3f}' for v in coef_sorted['coefficient']],
+            textposition='outside'
+        ))
+        fig.update_layout(height=400)
+        st.plotly_chart(fig, use_container_width=True)
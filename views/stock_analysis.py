@@ -0,0 +1,94 @@
+"""
+5X Finder - 🔍 종목 분석 페이지
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from resources import load_data, load_model, load_features
+
+st.title("🔍 종목 분석")
+st.markdown("### 종목을 선택하면 5배 성장 가능성을 예측합니다")
+
+try:
+    dataset = load_data()
+    model = load_model()
+    features = load_features()
+    data_loaded = True
+except Exception as e:
+    st.error(f"데이터 로드 실패: {e}")
+    data_loaded = False
+
+if data_loaded:
+    st.markdown("---")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        tickers = sorted(dataset['ticker'].unique())
+        popular = ['TSLA', 'AAPL', 'AMZN', 'GOOGL', 'META', 'MSFT', 'NVDA', 'NFLX']
+        popular_available = [t for t in popular if t in tickers]
+        other_tickers = [t for t in tickers if t not in popular]
+        sorted_tickers = popular_available + other_tickers
+
+        selected_ticker = st.selectbox("📌 종목 선택", sorted_tickers, index=0)
+
+    with col2:
+        available_years = sorted(dataset[dataset['ticker'] == selected_ticker]['start_year'].unique())
+        selected_year = st.selectbox("📅 시작 연도 선택", available_years, index=0)
+
+    row = dataset[(dataset['ticker'] == selected_ticker) & (dataset['start_year'] == selected_year)]
+
+    if len(row) > 0:
+        row = row.iloc[0]
+        X = row[features].values.reshape(1, -1)
+
+        prob = model.predict_proba(X)[0][1]
+        prediction = model.predict(X)[0]
+        actual = int(row['target_5x'])
+
+        st.markdown("---")
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("5배 달성 확률", f"{prob*100:.1f}%", delta="높음" if prob > 0.5 else "낮음")
+        with col2:
+            st.metric("모델 예측", "5배 달성" if prediction == 1 else "미달성")
+        with col3:
+            st.metric(f"실제 결과 ({selected_year}→{selected_year+5})", "5배 달성" if actual == 1 else "미달성")
+
+        st.markdown("---")
+
+        if prediction == actual:
+            if actual == 1:
+                st.success(f"**정확한 예측!** {selected_ticker}는 5년간 5배 이상 성장, 모델도 예측 성공")
+            else:
+                st.success(f"**정확한 예측!** {selected_ticker}는 5배 미달성, 모델도 정확히 예측")
+        else:
+            if actual == 1:
+                st.warning(f"**False Negative** {selected_ticker}는 실제 5배 달성, 모델은 미달성 예측")
+            else:
+                st.warning(f"**False Positive** {selected_ticker}는 실제 미달성, 모델은 5배 달성 예측")
+
+        st.markdown("---")
+        st.markdown("### 🎯 예측 근거 (Feature 기여도)")
+
+        contributions = X[0] * model.coef_[0]
+
+        contrib_df = pd.DataFrame({'Feature': features, '기여도': contributions})
+        contrib_df['abs_contrib'] = contrib_df['기여도'].abs()
+        contrib_df = contrib_df.sort_values('abs_contrib', ascending=False).head(10)
+        contrib_df = contrib_df.sort_values('기여도', ascending=True)
+
+        colors = ['#27ae60' if x > 0 else '#e74c3c' for x in contrib_df['기여도']]
+
+        fig = go.Figure(go.Bar(
+            x=contrib_df['기여도'], y=contrib_df['Feature'],
+            orientation='h', marker_color=colors,
+            text=[f'{v:+.3f}' for v in contrib_df['기여도']],
+            textposition='outside'
+        ))
+        fig.update_layout(title=f'{selected_ticker} ({selected_year}) Feature 기여도', height=400)
+        st.plotly_chart(fig, use_container_width=True)